@@ -26,12 +26,16 @@
 ## \addtogroup draftguitools
 # @{
 import math
+from collections import deque
+
 import pivy.coin as coin
+import PySide.QtCore as QtCore
 import PySide.QtGui as QtGui
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
 import FreeCAD
 import FreeCADGui
+import Part
 import Draft
 import Draft_rc
 import DraftVecUtils
@@ -53,10 +57,60 @@ __url__ = "https://www.freecadweb.org"
 class Draft_SelectPlane:
     """The Draft_SelectPlane FreeCAD command definition."""
 
+    # Icons shared by all invocations, built once on first use so the
+    # SVG resources are only parsed and rasterized a single time
+    _ICONS = None
+
+    # Canonical axes used by the Top/Front/Side buttons
+    _AX_TOP = FreeCAD.Vector(0, 0, 1)
+    _AX_FRONT = FreeCAD.Vector(0, -1, 0)
+    _AX_SIDE = FreeCAD.Vector(1, 0, 0)
+
+    @classmethod
+    def _get_icons(cls):
+        """Return the dictionary of task panel icons, building it on first use."""
+        if cls._ICONS is None:
+            cls._ICONS = {
+                'window': QtGui.QIcon(":/icons/Draft_SelectPlane.svg"),
+                'top': QtGui.QIcon(":/icons/view-top.svg"),
+                'front': QtGui.QIcon(":/icons/view-front.svg"),
+                'side': QtGui.QIcon(":/icons/view-right.svg"),
+                'align': QtGui.QIcon(":/icons/view-isometric.svg"),
+                'auto': QtGui.QIcon(":/icons/view-axonometric.svg"),
+                'move': QtGui.QIcon(":/icons/Draft_Move.svg"),
+                'center': QtGui.QIcon(":/icons/view-fullscreen.svg"),
+                'previous': QtGui.QIcon(":/icons/edit-undo.svg")
+            }
+        return cls._ICONS
+
     def __init__(self):
         self.ac = "FreeCAD.DraftWorkingPlane.alignToPointAndAxis"
         self.param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
-        self.states = []
+        # Plane snapshots for the Previous button; bounded so a long
+        # session cannot accumulate thousands of stale Vector references
+        self.states = deque(maxlen=64)
+        self.taskd = None
+        self.call = None
+        self._connected = False
+        self._snapper = None
+        # Set when a handler already emitted the grid update as part of
+        # its own command, so display() doesn't emit a second one
+        self._gridUpdated = False
+        # Translated toolbar strings, cached on first use: translating
+        # here would run before the Qt translators are installed
+        self._trDir = None
+        self._trOffset = None
+        self._trCustom = None
+        self._trCWP = None
+        # Debounce timer so rapid edits of the grid and snap fields only
+        # trigger one Snapper rebuild once the user stops typing
+        self._settingsTimer = QtCore.QTimer()
+        self._settingsTimer.setSingleShot(True)
+        self._settingsTimer.setInterval(250)
+        self._settingsTimer.timeout.connect(self._applySettings)
+        self._pendingGridText = None
+        self._pendingMainline = None
+        self._pendingSnapRadius = None
 
     def GetResources(self):
         """Set icon, menu and tooltip."""
@@ -79,6 +133,11 @@ class Draft_SelectPlane:
 
     def Activated(self):
         """Execute when the command is called."""
+        # Remove any SoEvent callback leaked by a session that ended
+        # without finish(), while self.view still points to the view it
+        # was registered on
+        self._removeCallback()
+
         # Reset variables
         self.view = Draft.get3DView()
         self.wpButton = FreeCADGui.draftToolBar.wplabel
@@ -93,42 +152,17 @@ class Draft_SelectPlane:
                       "or a WP Proxy to define the drawing plane")
         _msg(m)
 
-        # Create task panel
         FreeCADGui.Control.closeDialog()
-        self.taskd = task_selectplane.SelectPlaneTaskPanel()
-
-        # Fill values
-        self.taskd.form.checkCenter.setChecked(self.param.GetBool("CenterPlaneOnView", False))
-        q = FreeCAD.Units.Quantity(self.param.GetFloat("gridSpacing", 1.0), FreeCAD.Units.Length)
-        self.taskd.form.fieldGridSpacing.setText(q.UserString)
-        self.taskd.form.fieldGridMainLine.setValue(self.param.GetInt("gridEvery", 10))
-        self.taskd.form.fieldSnapRadius.setValue(self.param.GetInt("snapRange", 8))
-
-        # Set icons
-        self.taskd.form.setWindowIcon(QtGui.QIcon(":/icons/Draft_SelectPlane.svg"))
-        self.taskd.form.buttonTop.setIcon(QtGui.QIcon(":/icons/view-top.svg"))
-        self.taskd.form.buttonFront.setIcon(QtGui.QIcon(":/icons/view-front.svg"))
-        self.taskd.form.buttonSide.setIcon(QtGui.QIcon(":/icons/view-right.svg"))
-        self.taskd.form.buttonAlign.setIcon(QtGui.QIcon(":/icons/view-isometric.svg"))
-        self.taskd.form.buttonAuto.setIcon(QtGui.QIcon(":/icons/view-axonometric.svg"))
-        self.taskd.form.buttonMove.setIcon(QtGui.QIcon(":/icons/Draft_Move.svg"))
-        self.taskd.form.buttonCenter.setIcon(QtGui.QIcon(":/icons/view-fullscreen.svg"))
-        self.taskd.form.buttonPrevious.setIcon(QtGui.QIcon(":/icons/edit-undo.svg"))
-
-        # Connect slots
-        self.taskd.form.buttonTop.clicked.connect(self.onClickTop)
-        self.taskd.form.buttonFront.clicked.connect(self.onClickFront)
-        self.taskd.form.buttonSide.clicked.connect(self.onClickSide)
-        self.taskd.form.buttonAlign.clicked.connect(self.onClickAlign)
-        self.taskd.form.buttonAuto.clicked.connect(self.onClickAuto)
-        self.taskd.form.buttonMove.clicked.connect(self.onClickMove)
-        self.taskd.form.buttonCenter.clicked.connect(self.onClickCenter)
-        self.taskd.form.buttonPrevious.clicked.connect(self.onClickPrevious)
-        self.taskd.form.fieldGridSpacing.textEdited.connect(self.onSetGridSize)
-        self.taskd.form.fieldGridMainLine.valueChanged.connect(self.onSetMainline)
-        self.taskd.form.fieldSnapRadius.valueChanged.connect(self.onSetSnapRadius)
-
-        # Try to find a WP from the current selection
+        # The previous session may have ended without finish() running,
+        # e.g. via the Close button or another command taking over the
+        # task view; drop the stale bookkeeping it left behind. The old
+        # panel's form widget is deleted with the dialog, so a leftover
+        # reference would crash handle() and getOffset() below
+        self.taskd = None
+        self._connected = False
+
+        # Try to find a WP from the current selection, before spending
+        # any time on a task panel those paths would never show
         if self.handle():
             return
 
@@ -139,27 +173,111 @@ class Draft_SelectPlane:
             self.finish()
             return
 
+        # Create task panel. The form widget gets reparented into the
+        # task view when the dialog is shown and deleted together with
+        # it on closeDialog(), so the panel cannot be reused and has to
+        # be rebuilt per invocation; only the icons are cached.
+        self.taskd = task_selectplane.SelectPlaneTaskPanel()
+        self.setupTaskPanel()
+
+        # Fill values before connecting the slots: setValue() emits
+        # valueChanged, which would otherwise arm the settings debounce
+        # timer just for restoring the stored preferences
+        self.taskd.form.checkCenter.setChecked(self.param.GetBool("CenterPlaneOnView", False))
+        q = FreeCAD.Units.Quantity(self.param.GetFloat("gridSpacing", 1.0), FreeCAD.Units.Length)
+        self.taskd.form.fieldGridSpacing.setText(q.UserString)
+        self.taskd.form.fieldGridMainLine.setValue(self.param.GetInt("gridEvery", 10))
+        self.taskd.form.fieldSnapRadius.setValue(self.param.GetInt("snapRange", 8))
+
+        # Connect slots
+        self._connectSignals()
+
         # Execute the actual task panel
         FreeCADGui.Control.showDialog(self.taskd)
         self.call = self.view.addEventCallback("SoEvent", self.action)
 
-    def finish(self, close=False):
-        """Execute when the command is terminated."""
-        # Store values
-        self.param.SetBool("CenterPlaneOnView",
-                           self.taskd.form.checkCenter.isChecked())
+    def setupTaskPanel(self):
+        """Set the icons of a freshly built task panel."""
+        icons = self._get_icons()
+        self.taskd.form.setWindowIcon(icons['window'])
+        self.taskd.form.buttonTop.setIcon(icons['top'])
+        self.taskd.form.buttonFront.setIcon(icons['front'])
+        self.taskd.form.buttonSide.setIcon(icons['side'])
+        self.taskd.form.buttonAlign.setIcon(icons['align'])
+        self.taskd.form.buttonAuto.setIcon(icons['auto'])
+        self.taskd.form.buttonMove.setIcon(icons['move'])
+        self.taskd.form.buttonCenter.setIcon(icons['center'])
+        self.taskd.form.buttonPrevious.setIcon(icons['previous'])
+
+    def _signalPairs(self):
+        """Return the (signal, slot) pairs wired to the task panel."""
+        form = self.taskd.form
+        return [(form.buttonTop.clicked, self.onClickTop),
+                (form.buttonFront.clicked, self.onClickFront),
+                (form.buttonSide.clicked, self.onClickSide),
+                (form.buttonAlign.clicked, self.onClickAlign),
+                (form.buttonAuto.clicked, self.onClickAuto),
+                (form.buttonMove.clicked, self.onClickMove),
+                (form.buttonCenter.clicked, self.onClickCenter),
+                (form.buttonPrevious.clicked, self.onClickPrevious),
+                (form.fieldGridSpacing.textEdited, self.onSetGridSize),
+                (form.fieldGridMainLine.valueChanged, self.onSetMainline),
+                (form.fieldSnapRadius.valueChanged, self.onSetSnapRadius)]
+
+    def _connectSignals(self):
+        """Connect the task panel signals for the current invocation."""
+        if self.taskd is None or self._connected:
+            return
+        for signal, slot in self._signalPairs():
+            signal.connect(slot)
+        self._connected = True
 
-        # Terminate coin callbacks
-        if self.call:
+    def _disconnectSignals(self):
+        """Disconnect the task panel signals again.
+
+        Leaving the connections in place would keep the command instance
+        reachable through the bound-method slots while it is inactive.
+        """
+        if self.taskd is None or not self._connected:
+            return
+        for signal, slot in self._signalPairs():
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                # Qt raises if the connection is already gone
+                pass
+        self._connected = False
+
+    def _removeCallback(self):
+        """Unregister the SoEvent callback if one is registered."""
+        if getattr(self, "call", None):
             try:
                 self.view.removeEventCallback("SoEvent", self.call)
             except RuntimeError:
                 # The view has been deleted already
                 pass
-            self.call = None
+            finally:
+                self.call = None
+
+    def finish(self, close=False):
+        """Execute when the command is terminated."""
+        # Store values
+        if self.taskd is not None:
+            try:
+                self.param.SetBool("CenterPlaneOnView",
+                                   self.taskd.form.checkCenter.isChecked())
+            except RuntimeError:
+                # The form widget has already been deleted
+                pass
+
+        # Terminate coin callbacks
+        self._removeCallback()
 
-        # Reset everything else
+        # Reset everything else. Closing the dialog deletes the form
+        # widget, so the panel reference is dropped along with it
+        self._disconnectSignals()
         FreeCADGui.Control.closeDialog()
+        self.taskd = None
         FreeCAD.DraftWorkingPlane.restore()
         FreeCADGui.ActiveDocument.resetEdit()
         return True
@@ -189,59 +307,51 @@ class Draft_SelectPlane:
         sel = FreeCADGui.Selection.getSelectionEx()
         if len(sel) == 1:
             sel = sel[0]
-            if hasattr(sel.Object, 'TypeId') and sel.Object.TypeId == 'App::Part':
-                self.setPlaneFromObjPlacement(sel.Object)
-                return True
-            elif Draft.getType(sel.Object) == "Axis":
-                FreeCAD.DraftWorkingPlane.alignToEdges(sel.Object.Shape.Edges)
-                self.display(FreeCAD.DraftWorkingPlane.axis)
-                return True
-            elif Draft.getType(sel.Object) in ("WorkingPlaneProxy", "BuildingPart"):
-                self.setPlaneOnWPProxy(sel.Object)
+            obj = sel.Object
+            if hasattr(obj, 'TypeId') and obj.TypeId == 'App::Part':
+                self.setPlaneFromObjPlacement(obj)
                 return True
-            elif Draft.getType(sel.Object) == "SectionPlane":
-                self.setPlaneFromObjPlacement(sel.Object)
+            # Fetch the Draft type once and dispatch on it instead of
+            # testing the object against every known type in turn
+            handler = self._typeHandlers.get(Draft.getType(obj))
+            if handler:
+                handler(self, obj)
                 return True
-            elif sel.HasSubObjects:
-                if len(sel.SubElementNames) == 1:
+            if sel.HasSubObjects:
+                names = sel.SubElementNames
+                if len(names) == 1:
                     # look for a face or a plane
-                    if "Face" in sel.SubElementNames[0]:
+                    if names[0].startswith("Face"):
                         FreeCAD.DraftWorkingPlane.alignToFace(sel.SubObjects[0], self.getOffset())
                         self.display(FreeCAD.DraftWorkingPlane.axis)
                         return True
-                    elif sel.SubElementNames[0] == "Plane":
-                        FreeCAD.DraftWorkingPlane.setFromPlacement(sel.Object.Placement, rebase=True)
+                    elif names[0] == "Plane":
+                        FreeCAD.DraftWorkingPlane.setFromPlacement(obj.Placement, rebase=True)
                         self.display(FreeCAD.DraftWorkingPlane.axis)
                         return True
-                elif len(sel.SubElementNames) == 3:
+                elif len(names) == 3:
                     # look for 3 points
-                    if ("Vertex" in sel.SubElementNames[0]) \
-                    and ("Vertex" in sel.SubElementNames[1]) \
-                    and ("Vertex" in sel.SubElementNames[2]):
+                    if all(n.startswith("Vertex") for n in names):
                         FreeCAD.DraftWorkingPlane.alignTo3Points(sel.SubObjects[0].Point,
                                                                  sel.SubObjects[1].Point,
                                                                  sel.SubObjects[2].Point,
                                                                  self.getOffset())
                         self.display(FreeCAD.DraftWorkingPlane.axis)
                         return True
-            elif sel.Object.isDerivedFrom("Part::Feature"):
-                if sel.Object.Shape:
-                    if len(sel.Object.Shape.Faces) == 1:
-                        FreeCAD.DraftWorkingPlane.alignToFace(sel.Object.Shape.Faces[0], self.getOffset())
+            elif obj.isDerivedFrom("Part::Feature"):
+                if obj.Shape:
+                    if len(obj.Shape.Faces) == 1:
+                        FreeCAD.DraftWorkingPlane.alignToFace(obj.Shape.Faces[0], self.getOffset())
                         self.display(FreeCAD.DraftWorkingPlane.axis)
                         return True
-            elif hasattr(sel.Object, 'Placement'):
-                self.setPlaneFromObjPlacement(sel.Object)
+            elif hasattr(obj, 'Placement'):
+                self.setPlaneFromObjPlacement(obj)
                 return True
 
         elif sel:
             # look for 3 points
-            subs = []
-            import Part
-            for s in sel:
-                for so in s.SubObjects:
-                    if isinstance(so, Part.Vertex):
-                        subs.append(so)
+            subs = [so for s in sel for so in s.SubObjects
+                    if isinstance(so, Part.Vertex)]
             if len(subs) == 3:
                 FreeCAD.DraftWorkingPlane.alignTo3Points(subs[0].Point,
                                                          subs[1].Point,
@@ -261,72 +371,84 @@ class Draft_SelectPlane:
         FreeCAD.DraftWorkingPlane.weak = False
         self.display(FreeCAD.DraftWorkingPlane.axis)
         self.wpButton.setText(obj.Label)
-        self.wpButton.setToolTip(translate("draft", "Current working plane")+": " + self.wpButton.text())
+        self.wpButton.setToolTip(self._trCWP + ": " + self.wpButton.text())
         m = translate("draft", "Working plane aligned to global placement of")
         _msg(m + " " + obj.Label + ".\n")
         return True
 
+    def setPlaneFromAxis(self, obj):
+        """Called by handle(): align the working plane to an Axis object."""
+        FreeCAD.DraftWorkingPlane.alignToEdges(obj.Shape.Edges)
+        self.display(FreeCAD.DraftWorkingPlane.axis)
+        return True
+
     def setPlaneOnWPProxy(self, obj):
         """Called by handle(): set the working plane according to a WorkingPlaneProxy or a BuildingPart.
         This method also apply the clipping view according to object properties.
         """
         FreeCAD.DraftWorkingPlane.setFromPlacement(obj.Placement, rebase=True)
         FreeCAD.DraftWorkingPlane.weak = False
-        if hasattr(obj.ViewObject, "AutoWorkingPlane"):
-            if obj.ViewObject.AutoWorkingPlane:
-                FreeCAD.DraftWorkingPlane.weak = True
-        if hasattr(obj.ViewObject, "CutView") and hasattr(obj.ViewObject, "AutoCutView"):
-            if obj.ViewObject.AutoCutView:
-                obj.ViewObject.CutView = True
-        if hasattr(obj.ViewObject, "RestoreView"):
-            if obj.ViewObject.RestoreView:
-                if hasattr(obj.ViewObject, "ViewData"):
-                    if len(obj.ViewObject.ViewData) >= 12:
-                        d = obj.ViewObject.ViewData
-                        camtype = "orthographic"
-                        if len(obj.ViewObject.ViewData) == 13:
-                            if d[12] == 1:
-                                camtype = "perspective"
-                        c = FreeCADGui.ActiveDocument.ActiveView.getCameraNode()
-                        if isinstance(c, coin.SoOrthographicCamera):
-                            if camtype == "perspective":
-                                FreeCADGui.ActiveDocument.ActiveView.setCameraType("Perspective")
-                        elif isinstance(c, coin.SoPerspectiveCamera):
-                            if camtype == "orthographic":
-                                FreeCADGui.ActiveDocument.ActiveView.setCameraType("Orthographic")
-                        c = FreeCADGui.ActiveDocument.ActiveView.getCameraNode()
-                        c.position.setValue([d[0], d[1], d[2]])
-                        c.orientation.setValue([d[3], d[4], d[5], d[6]])
-                        c.nearDistance.setValue(d[7])
-                        c.farDistance.setValue(d[8])
-                        c.aspectRatio.setValue(d[9])
-                        c.focalDistance.setValue(d[10])
-                        if camtype == "orthographic":
-                            c.height.setValue(d[11])
-                        else:
-                            c.heightAngle.setValue(d[11])
-        if hasattr(obj.ViewObject, "RestoreState"):
-            if obj.ViewObject.RestoreState:
-                if hasattr(obj.ViewObject, "VisibilityMap"):
-                    if obj.ViewObject.VisibilityMap:
-                        for k,v in obj.ViewObject.VisibilityMap.items():
-                            o = FreeCADGui.ActiveDocument.getObject(k)
-                            if o:
-                                if o.Visibility != (v == "True"):
-                                    FreeCADGui.doCommand("FreeCADGui.ActiveDocument.getObject(\""+k+"\").Visibility = "+v)
+        # Fetch the view object and its properties once instead of doing
+        # a hasattr/getattr round-trip for each access
+        vo = obj.ViewObject
+        if getattr(vo, "AutoWorkingPlane", False):
+            FreeCAD.DraftWorkingPlane.weak = True
+        if hasattr(vo, "CutView") and getattr(vo, "AutoCutView", False):
+            vo.CutView = True
+        view_data = getattr(vo, "ViewData", None)
+        if getattr(vo, "RestoreView", False) and view_data and len(view_data) >= 12:
+            d = view_data
+            camtype = "orthographic"
+            if len(d) == 13 and d[12] == 1:
+                camtype = "perspective"
+            av = FreeCADGui.ActiveDocument.ActiveView
+            c = av.getCameraNode()
+            # Only refetch the camera node if the camera type changed
+            if isinstance(c, coin.SoOrthographicCamera):
+                if camtype == "perspective":
+                    av.setCameraType("Perspective")
+                    c = av.getCameraNode()
+            elif isinstance(c, coin.SoPerspectiveCamera):
+                if camtype == "orthographic":
+                    av.setCameraType("Orthographic")
+                    c = av.getCameraNode()
+            c.position.setValue([d[0], d[1], d[2]])
+            c.orientation.setValue([d[3], d[4], d[5], d[6]])
+            c.nearDistance.setValue(d[7])
+            c.farDistance.setValue(d[8])
+            c.aspectRatio.setValue(d[9])
+            c.focalDistance.setValue(d[10])
+            if camtype == "orthographic":
+                c.height.setValue(d[11])
+            else:
+                c.heightAngle.setValue(d[11])
+        visibility_map = getattr(vo, "VisibilityMap", None)
+        if getattr(vo, "RestoreState", False) and visibility_map:
+            for k, v in visibility_map.items():
+                o = FreeCADGui.ActiveDocument.getObject(k)
+                if o:
+                    if o.Visibility != (v == "True"):
+                        FreeCADGui.doCommand("FreeCADGui.ActiveDocument.getObject(\""+k+"\").Visibility = "+v)
         self.display(FreeCAD.DraftWorkingPlane.axis)
         self.wpButton.setText(obj.Label)
-        self.wpButton.setToolTip(translate("draft", "Current working plane")+": "+self.wpButton.text())
-
-    def getCenterPoint(self, x, y, z):
-        """Get the center point."""
+        self.wpButton.setToolTip(self._trCWP + ": " + self.wpButton.text())
+
+    # Dispatch table used by handle(): Draft type -> plane setter method
+    _typeHandlers = {
+        "Axis": setPlaneFromAxis,
+        "WorkingPlaneProxy": setPlaneOnWPProxy,
+        "BuildingPart": setPlaneOnWPProxy,
+        "SectionPlane": setPlaneFromObjPlacement,
+    }
+
+    def getCenterPoint(self, v):
+        """Get the center point of the view projected on the axis `v`."""
         if not self.taskd.form.checkCenter.isChecked():
             return FreeCAD.Vector()
-        v = FreeCAD.Vector(x, y, z)
         view = FreeCADGui.ActiveDocument.ActiveView
         camera = view.getCameraNode()
         cam1 = FreeCAD.Vector(camera.position.getValue().getValue())
-        cam2 = FreeCADGui.ActiveDocument.ActiveView.getViewDirection()
+        cam2 = view.getViewDirection()
         vcam1 = DraftVecUtils.project(cam1, v)
         a = vcam1.getAngle(cam2)
         if a < 0.0001:
@@ -339,14 +461,15 @@ class Draft_SelectPlane:
 
     def tostr(self, v):
         """Make a string from a vector or tuple."""
-        string = "FreeCAD.Vector("
-        string += str(v[0]) + ", "
-        string += str(v[1]) + ", "
-        string += str(v[2]) + ")"
-        return string
+        return f"FreeCAD.Vector({v[0]}, {v[1]}, {v[2]})"
 
     def getOffset(self):
         """Return the offset value as a float in mm."""
+        if self.taskd is None:
+            # The panel only exists while its dialog is shown, so the
+            # pre-selection quick path always uses the default offset
+            # rather than a value typed during an earlier invocation
+            return 0.0
         try:
             o = float(self.taskd.form.fieldOffset.text())
         except Exception:
@@ -354,55 +477,49 @@ class Draft_SelectPlane:
             o = o.Value
         return o
 
+    def _emitAlign(self, center, axis, offset):
+        """Emit the command aligning the working plane to the given axis.
+
+        The grid update is included in the same emission, so a button
+        press goes through the macro recorder and the undo stack once
+        instead of once per command.
+        """
+        FreeCADGui.doCommandGui(f"{self.ac}({self.tostr(center)}, {self.tostr(axis)}, {offset})"
+                                "\nFreeCADGui.Snapper.setGrid()")
+        self._gridUpdated = True
+
     def onClickTop(self):
         """Execute when pressing the top button."""
-        offset = str(self.getOffset())
-        _cmd = self.ac
-        _cmd += "("
-        _cmd += self.tostr(self.getCenterPoint(0, 0, 1)) + ", "
-        _cmd += self.tostr((0, 0, 1)) + ", "
-        _cmd += offset
-        _cmd += ")"
-        FreeCADGui.doCommandGui(_cmd)
+        self._emitAlign(self.getCenterPoint(self._AX_TOP), self._AX_TOP, self.getOffset())
         self.display('Top')
         self.finish()
 
     def onClickFront(self):
         """Execute when pressing the front button."""
-        offset = str(self.getOffset())
-        _cmd = self.ac
-        _cmd += "("
-        _cmd += self.tostr(self.getCenterPoint(0, -1, 0)) + ", "
-        _cmd += self.tostr((0, -1, 0)) + ", "
-        _cmd += offset
-        _cmd += ")"
-        FreeCADGui.doCommandGui(_cmd)
+        self._emitAlign(self.getCenterPoint(self._AX_FRONT), self._AX_FRONT, self.getOffset())
         self.display('Front')
         self.finish()
 
     def onClickSide(self):
         """Execute when pressing the side button."""
-        offset = str(self.getOffset())
-        _cmd = self.ac
-        _cmd += "("
-        _cmd += self.tostr(self.getCenterPoint(1, 0, 0)) + ", "
-        _cmd += self.tostr((1, 0, 0)) + ", "
-        _cmd += offset
-        _cmd += ")"
-        FreeCADGui.doCommandGui(_cmd)
+        self._emitAlign(self.getCenterPoint(self._AX_SIDE), self._AX_SIDE, self.getOffset())
         self.display('Side')
         self.finish()
 
     def onClickAlign(self):
         """Execute when pressing the align."""
-        FreeCADGui.doCommandGui("FreeCAD.DraftWorkingPlane.setup(force=True)")
+        FreeCADGui.doCommandGui("FreeCAD.DraftWorkingPlane.setup(force=True)"
+                                "\nFreeCADGui.Snapper.setGrid()")
+        self._gridUpdated = True
         d = self.view.getViewDirection().negative()
         self.display(d)
         self.finish()
 
     def onClickAuto(self):
         """Execute when pressing the auto button."""
-        FreeCADGui.doCommandGui("FreeCAD.DraftWorkingPlane.reset()")
+        FreeCADGui.doCommandGui("FreeCAD.DraftWorkingPlane.reset()"
+                                "\nFreeCADGui.Snapper.setGrid()")
+        self._gridUpdated = True
         self.display('Auto')
         self.finish()
 
@@ -410,12 +527,8 @@ class Draft_SelectPlane:
         """Execute when pressing the move button."""
         sel = FreeCADGui.Selection.getSelectionEx()
         if sel:
-            verts = []
-            import Part
-            for s in sel:
-                for so in s.SubObjects:
-                    if isinstance(so, Part.Vertex):
-                        verts.append(so)
+            verts = [so for s in sel for so in s.SubObjects
+                     if isinstance(so, Part.Vertex)]
             if len(verts) == 1:
                 target = verts[0].Point
                 FreeCAD.DraftWorkingPlane.position = target
@@ -423,9 +536,10 @@ class Draft_SelectPlane:
                 self.finish()
         else:
             # move the WP to the center of the current view
-            c = FreeCADGui.ActiveDocument.ActiveView.getCameraNode()
+            av = FreeCADGui.ActiveDocument.ActiveView
+            c = av.getCameraNode()
             p = FreeCAD.Vector(c.position.getValue().getValue())
-            d = FreeCADGui.ActiveDocument.ActiveView.getViewDirection()
+            d = av.getViewDirection()
             pp = FreeCAD.DraftWorkingPlane.projectPoint(p, d)
             FreeCAD.DraftWorkingPlane.position = pp
             self.display(pp)
@@ -454,35 +568,78 @@ class Draft_SelectPlane:
             p.v = s[1]
             p.axis = s[2]
             p.position = s[3]
-            FreeCADGui.Snapper.setGrid()
+            snapper = self._snap()
+            if snapper:
+                snapper.setGrid()
             self.finish()
 
     def onSetGridSize(self, text):
         """Execute when setting the grid size."""
-        try:
-            q = FreeCAD.Units.Quantity(text)
-        except Exception:
-            pass
-        else:
-            self.param.SetFloat("gridSpacing", q.Value)
-            if hasattr(FreeCADGui, "Snapper"):
-                FreeCADGui.Snapper.setGrid()
+        self._pendingGridText = text
+        self._settingsTimer.start()
 
     def onSetMainline(self, i):
         """Execute when setting main line grid spacing."""
         if i > 1:
-            self.param.SetInt("gridEvery", i)
-            if hasattr(FreeCADGui, "Snapper"):
-                FreeCADGui.Snapper.setGrid()
+            self._pendingMainline = i
+            self._settingsTimer.start()
 
     def onSetSnapRadius(self, i):
         """Execute when setting the snap radius."""
-        self.param.SetInt("snapRange", i)
-        if hasattr(FreeCADGui, "Snapper"):
-            FreeCADGui.Snapper.showradius()
+        self._pendingSnapRadius = i
+        self._settingsTimer.start()
+
+    def _applySettings(self):
+        """Write the pending grid and snap settings and update the Snapper.
+
+        Called by the debounce timer once the user has stopped editing,
+        so the expensive grid rebuild runs only once per series of edits.
+        All pending parameters are written first and the Snapper is
+        updated at most once, even when several fields changed together.
+        """
+        update_grid = False
+        update_radius = False
+        if self._pendingGridText is not None:
+            try:
+                q = FreeCAD.Units.Quantity(self._pendingGridText)
+            except Exception:
+                pass
+            else:
+                self.param.SetFloat("gridSpacing", q.Value)
+                update_grid = True
+            self._pendingGridText = None
+        if self._pendingMainline is not None:
+            self.param.SetInt("gridEvery", self._pendingMainline)
+            update_grid = True
+            self._pendingMainline = None
+        if self._pendingSnapRadius is not None:
+            self.param.SetInt("snapRange", self._pendingSnapRadius)
+            update_radius = True
+            self._pendingSnapRadius = None
+        snapper = self._snap()
+        if snapper:
+            if update_grid:
+                snapper.setGrid()
+            if update_radius:
+                snapper.showradius()
+
+    def _snap(self):
+        """Return the global Snapper, caching the lookup after first use."""
+        if self._snapper is None:
+            self._snapper = getattr(FreeCADGui, "Snapper", None)
+        return self._snapper
+
+    def _cacheTranslations(self):
+        """Cache the translated toolbar strings on first use."""
+        if self._trDir is None:
+            self._trDir = translate("draft", "Dir")
+            self._trOffset = translate("draft", "Offset")
+            self._trCustom = translate("draft", "Custom")
+            self._trCWP = translate("draft", "Current working plane")
 
     def display(self, arg):
         """Set the text of the working plane button in the toolbar."""
+        self._cacheTranslations()
         o = self.getOffset()
         if o:
             if o > 0:
@@ -492,35 +649,38 @@ class Draft_SelectPlane:
         else:
             suffix = ''
         _vdir = FreeCAD.DraftWorkingPlane.axis
-        vdir = '('
-        vdir += str(_vdir.x)[:4] + ','
-        vdir += str(_vdir.y)[:4] + ','
-        vdir += str(_vdir.z)[:4]
-        vdir += ')'
-
-        vdir = " " + translate("draft", "Dir") + ": " + vdir
-        if type(arg).__name__ == 'str':
+        vdir = f"({_vdir.x:.4g},{_vdir.y:.4g},{_vdir.z:.4g})"
+        vdir = " " + self._trDir + ": " + vdir
+        if isinstance(arg, str):
             self.wpButton.setText(arg + suffix)
             if o != 0:
-                o = " " + translate("draft", "Offset") + ": " + str(o)
+                o = " " + self._trOffset + ": " + str(o)
             else:
                 o = ""
-            _tool = translate("draft", "Current working plane") + ": "
+            _tool = self._trCWP + ": "
             _tool += self.wpButton.text() + o + vdir
             self.wpButton.setToolTip(_tool)
-        elif type(arg).__name__ == 'Vector':
-            plv = '('
-            plv += str(arg.x)[:6] + ','
-            plv += str(arg.y)[:6] + ','
-            plv += str(arg.z)[:6]
-            plv += ')'
-            self.wpButton.setText(translate("draft", "Custom"))
-            _tool = translate("draft", "Current working plane")
+        elif isinstance(arg, FreeCAD.Vector):
+            plv = f"({arg.x:.6g},{arg.y:.6g},{arg.z:.6g})"
+            self.wpButton.setText(self._trCustom)
+            _tool = self._trCWP
             _tool += ": " + plv + vdir
             self.wpButton.setToolTip(_tool)
         p = FreeCAD.DraftWorkingPlane
+        grid_updated = self._gridUpdated
+        self._gridUpdated = False
+        if self.states:
+            s = self.states[-1]
+            if (p.u.isEqual(s[0], 1e-7)
+                    and p.v.isEqual(s[1], 1e-7)
+                    and p.axis.isEqual(s[2], 1e-7)
+                    and p.position.isEqual(s[3], 1e-7)):
+                # Same plane reselected: the grid doesn't need rebuilding
+                # and the state stack doesn't need another entry
+                return
         self.states.append([p.u, p.v, p.axis, p.position])
-        FreeCADGui.doCommandGui("FreeCADGui.Snapper.setGrid()")
+        if not grid_updated:
+            FreeCADGui.doCommandGui("FreeCADGui.Snapper.setGrid()")
 
 
 FreeCADGui.addCommand('Draft_SelectPlane', Draft_SelectPlane())